@@ -1,8 +1,26 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
+import os
 import re
 import tempfile
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Loaded models are expensive (hundreds of MB of torch state-dict unpickling),
+# so cache them per process. One lock per cache: Whisper and pyannote load
+# concurrently on CPU cold start, and a shared lock would serialize the two
+# stages for the whole duration of the Whisper load.
+_WHISPER_CACHE_LOCK = threading.Lock()
+_PYANNOTE_CACHE_LOCK = threading.Lock()
+_WHISPER_CACHE: dict = {}
+_PYANNOTE_CACHE: dict = {}
+
+# Compiled once; diarize_text_simple runs these per line over whole transcripts.
+_SPK_TAG_RE = re.compile(r"^(spk|speaker)\s*\d+[:\-]\s*", re.I)
+_SENT_SPLIT_RE = re.compile(r"(?<=[\.\?\!])\s+")
 
 
 def _mask_token(tok: str) -> str:
@@ -13,12 +31,13 @@ def _mask_token(tok: str) -> str:
     return tok[:4] + "…" + tok[-4:]
 
 def _fmt_ts(seconds: float) -> str:
+    # Called per segment in tight loops; integer divmod avoids float modulo.
     if seconds < 0:
         seconds = 0.0
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = seconds % 60
-    return f"{h:02d}:{m:02d}:{s:06.3f}"
+    ms = int(seconds * 1000 + 0.5)
+    m, ms = divmod(ms, 60_000)
+    h, m = divmod(m, 60)
+    return f"{h:02d}:{m:02d}:{ms // 1000:02d}.{ms % 1000:03d}"
 
 
 def _convert_to_pcm_wav_16k_mono(src_path: str, log_cb=None) -> str:
@@ -55,7 +74,96 @@ def _convert_to_pcm_wav_16k_mono(src_path: str, log_cb=None) -> str:
 
     return out_path
 
+def _configure_hf_env(log_cb=None) -> None:
+    """Tune HuggingFace Hub env vars before model/pipeline downloads.
+
+    - HF_HOME: left alone when the user set it or already has a populated
+      default cache (~/.cache/huggingface) — repointing would abandon
+      multi-GB downloads. Only on a pristine machine does it move under
+      ~/.cache/AISTATElight so the cache location is ours going forward.
+    - HF_HUB_ENABLE_HF_TRANSFER: parallel Rust download backend; only enabled
+      when the optional `hf_transfer` package is actually installed, because
+      huggingface_hub errors out if the flag is set without it.
+
+    HF_HUB_OFFLINE is deliberately not touched: the diarization pipeline
+    pulls segmentation/embedding weights from separate repos, so a partially
+    populated cache would flip the whole process (and worker subprocesses,
+    which inherit the env) into offline mode and hard-fail later loads.
+    """
+    if "HF_HOME" not in os.environ:
+        default_home = os.path.join(os.path.expanduser("~/.cache"), "huggingface")
+        if not os.path.isdir(default_home):
+            os.environ["HF_HOME"] = os.path.join(
+                os.path.expanduser("~/.cache"), "AISTATElight", "huggingface"
+            )
+    try:
+        import hf_transfer  # type: ignore  # noqa: F401
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    except Exception:
+        pass
+
+
+def _best_torch_device():
+    """Pick the accelerator for local inference: cuda > mps > None (cpu)."""
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return torch.device("cuda")
+        mps = getattr(torch.backends, "mps", None)
+        if mps is not None and mps.is_available():
+            return torch.device("mps")
+    except Exception:
+        pass
+    return None
+
+
+def _load_whisper_model_cached(whisper_mod, model: str):
+    """Return a Whisper model, reusing a previously loaded instance if possible."""
+    with _WHISPER_CACHE_LOCK:
+        wmodel = _WHISPER_CACHE.get(model)
+        if wmodel is None:
+            wmodel = whisper_mod.load_model(model)
+            _WHISPER_CACHE[model] = wmodel
+        return wmodel
+
+
 def _load_pyannote_pipeline(Pipeline, hf_token: str, log_cb=None):
+    """Cached front-end for _load_pyannote_pipeline_uncached.
+
+    Keyed by a short token digest (not the token itself) so repeated
+    diarizations in one session skip the whole trial-and-error load.
+    """
+    _configure_hf_env(log_cb)
+    key = hashlib.blake2b((hf_token or "").encode("utf-8"), digest_size=8).hexdigest()
+    with _PYANNOTE_CACHE_LOCK:
+        pipe = _PYANNOTE_CACHE.get(key)
+    if pipe is not None:
+        if log_cb:
+            log_cb("pyannote: reusing cached pipeline")
+        return pipe
+
+    pipe = _load_pyannote_pipeline_uncached(Pipeline, hf_token, log_cb)
+
+    # Segmentation/embedding nets dominate diarization cost and are
+    # CUDA/MPS-friendly; move the pipeline off the CPU when possible.
+    dev = _best_torch_device()
+    if dev is not None:
+        try:
+            pipe.to(dev)
+            if log_cb:
+                log_cb(f"pyannote: pipeline running on {dev.type}")
+        except Exception as e:
+            if log_cb:
+                log_cb(f"pyannote: could not move pipeline to {dev.type} ({e}); staying on cpu")
+    elif log_cb:
+        log_cb("pyannote: pipeline running on cpu")
+
+    with _PYANNOTE_CACHE_LOCK:
+        _PYANNOTE_CACHE[key] = pipe
+    return pipe
+
+
+def _load_pyannote_pipeline_uncached(Pipeline, hf_token: str, log_cb=None):
     """Load pyannote diarization pipeline in a version-compatible way.
 
     Tries multiple pipeline IDs because HF repo pointers / requirements evolve.
@@ -80,9 +188,46 @@ def _load_pyannote_pipeline(Pipeline, hf_token: str, log_cb=None):
         ("access_token", hf_token),
     ]
 
+    # Narrow the grid to kwargs the installed from_pretrained actually accepts:
+    # each failed attempt below can cost network metadata requests, so probing
+    # kwargs that can only raise TypeError is wasted work. If the signature is
+    # opaque (**kwargs only), keep the full candidate list.
+    try:
+        import inspect
+        params = inspect.signature(Pipeline.from_pretrained).parameters
+        if not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+            supported = [(kw, val) for kw, val in kw_candidates if kw in params]
+            if supported:
+                kw_candidates = supported
+    except Exception:
+        pass
+
+    # Authoritative error classes: a gated/missing repo fails the same way for
+    # every kwarg, and a rejected token fails for every combination — no point
+    # paying an HTTPS round-trip per grid cell to rediscover that.
+    try:
+        from huggingface_hub.utils import (  # type: ignore
+            GatedRepoError, RepositoryNotFoundError, HfHubHTTPError,
+        )
+    except Exception:
+        GatedRepoError = RepositoryNotFoundError = HfHubHTTPError = ()  # type: ignore[assignment]
+
     last_exc = None
 
     log("pyannote: creating pipeline (compat loader)…")
+
+    # Try a previously successful (pipeline id, kwarg) combination first so a
+    # reload does not re-walk the whole compatibility grid.
+    last_good = _PYANNOTE_CACHE.get("_last_good")
+    if last_good:
+        pid, kw = last_good
+        try:
+            log(f"pyannote: trying last-good pipeline '{pid}' ({kw or 'no token'})")
+            pipe = Pipeline.from_pretrained(pid, **({kw: hf_token} if kw else {}))
+            log(f"pyannote: pipeline loaded OK: {pid} ({kw or 'no token'})")
+            return pipe
+        except Exception as e:
+            last_exc = e
     # Log versions to help debugging
     try:
         import pyannote.audio  # type: ignore
@@ -95,12 +240,14 @@ def _load_pyannote_pipeline(Pipeline, hf_token: str, log_cb=None):
     except Exception:
         pass
 
+    token_rejected = False
     for pid in pipeline_ids:
         for kw, val in kw_candidates:
             try:
                 log(f"pyannote: trying pipeline '{pid}' with {kw}=***")
                 pipe = Pipeline.from_pretrained(pid, **{kw: val})
                 log(f"pyannote: pipeline loaded OK: {pid} ({kw})")
+                _PYANNOTE_CACHE["_last_good"] = (pid, kw)
                 return pipe
             except TypeError as e:
                 # kw not supported by this version
@@ -119,7 +266,20 @@ def _load_pyannote_pipeline(Pipeline, hf_token: str, log_cb=None):
             except Exception as e:
                 last_exc = e
                 # could be 401/403 gated or download errors
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if isinstance(e, HfHubHTTPError) and status == 401:
+                    # Authoritative for the settings token only: the no-token
+                    # fallback below uses the ambient huggingface-cli login,
+                    # which may still work.
+                    log("pyannote: token rejected (HTTP 401) — skipping remaining token attempts.")
+                    token_rejected = True
+                    break
+                if isinstance(e, (GatedRepoError, RepositoryNotFoundError)):
+                    log(f"pyannote: no access to '{pid}' (gated or not found) — trying next pipeline id.")
+                    break
                 continue
+        if token_rejected:
+            break
 
     # Last resort: try without token (works if user did `huggingface-cli login`)
     for pid in pipeline_ids:
@@ -127,6 +287,7 @@ def _load_pyannote_pipeline(Pipeline, hf_token: str, log_cb=None):
             log(f"pyannote: trying pipeline '{pid}' without token (HF login/env)…")
             pipe = Pipeline.from_pretrained(pid)
             log(f"pyannote: pipeline loaded OK without token: {pid}")
+            _PYANNOTE_CACHE["_last_good"] = (pid, None)
             return pipe
         except Exception as e:
             last_exc = e
@@ -141,28 +302,30 @@ def _load_pyannote_pipeline(Pipeline, hf_token: str, log_cb=None):
 def whisper_transcribe(audio_path: str, model: str, language: str, log_cb=None, progress_cb=None):
     if log_cb: log_cb(f"Whisper: load '{model}' (auto-download if missing)")
     if progress_cb: progress_cb(5)
+    _configure_hf_env(log_cb)
     try:
         import whisper
     except Exception as e:
         raise RuntimeError("Missing 'openai-whisper'. Install: pip install openai-whisper") from e
 
-    wmodel = whisper.load_model(model)
+    wmodel = _load_whisper_model_cached(whisper, model)
     if log_cb: log_cb("Whisper: model loaded. Transcribing")
     if progress_cb: progress_cb(20)
 
     lang = None if language == "auto" else language
-    result = wmodel.transcribe(audio_path, language=lang, verbose=False)
+    dev = _best_torch_device()
+    fp16 = dev is not None and dev.type == "cuda"
+    if log_cb: log_cb(f"Whisper: device={dev.type if dev else 'cpu'}, fp16={fp16}")
+    result = wmodel.transcribe(audio_path, language=lang, verbose=False, fp16=fp16)
     if progress_cb: progress_cb(90)
 
     text = (result.get("text") or "").strip()
     segments = result.get("segments") or []
-    lines = []
-    for seg in segments:
-        s0 = float(seg.get("start", 0.0))
-        s1 = float(seg.get("end", 0.0))
-        t = (seg.get("text") or "").strip()
-        if t:
-            lines.append(f"[{_fmt_ts(s0)} - {_fmt_ts(s1)}] {t}")
+    lines = [
+        f"[{_fmt_ts(float(seg.get('start', 0.0)))} - {_fmt_ts(float(seg.get('end', 0.0)))}] {t}"
+        for seg, t in ((seg, (seg.get("text") or "").strip()) for seg in segments)
+        if t
+    ]
     text_ts = "\n".join(lines).strip() if lines else text
 
     if progress_cb: progress_cb(100)
@@ -193,7 +356,6 @@ def whisper_transcribe_safe(
     import sys
     import threading
     import queue
-    import re
 
     worker_py = sys.executable  # use same venv/interpreter as GUI
     if log_cb:
@@ -226,7 +388,7 @@ def whisper_transcribe_safe(
         text=False,  # IMPORTANT: binary mode for live tqdm (\r) streaming
         bufsize=0,
         cwd=os.path.dirname(os.path.dirname(__file__)),  # project root
-        env={**os.environ.copy(), "PYTHONUNBUFFERED": "1"},
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
     )
 
     stderr_q: "queue.Queue[str]" = queue.Queue()
@@ -322,8 +484,11 @@ def whisper_transcribe_safe(
         )
         return {"kind": "transcript", "text": fail_text, "text_ts": "", "ok": False}
 
-    out_str = (out or "").strip()
-    if not out_str:
+    # Parse JSON (guard against any accidental pollution): raw_decode skips
+    # the prefix and stops at the end of the outer object, so noise before or
+    # after the JSON is harmless and the buffer is never copied by strip().
+    idx = out.find("{")
+    if idx < 0:
         tail_txt = "\n".join((err or "").strip().splitlines()[-20:])
         fail_text = (
             "[Transcription exception]\n"
@@ -332,15 +497,7 @@ def whisper_transcribe_safe(
         )
         return {"kind": "transcript", "text": fail_text, "text_ts": "", "ok": False}
 
-    # Parse JSON (guard against any accidental pollution)
-    try:
-        data = json.loads(out_str)
-    except Exception:
-        m = list(re.finditer(r"\{[\s\S]*\}\s*$", out_str))
-        if m:
-            data = json.loads(m[-1].group(0))
-        else:
-            raise
+    data, _end = json.JSONDecoder().raw_decode(out, idx)
 
     if not isinstance(data, dict):
         return {"kind": "transcript", "text": str(data), "text_ts": "", "ok": True}
@@ -367,17 +524,34 @@ def diarize_text_simple(text: str, speakers: int, method: str, log_cb=None, prog
         return {"kind": "diarized_text", "text": ""}
 
     m = (method or "").lower()
+    # Classify the free-form method string once instead of re-scanning it at
+    # every branch below (check order mirrors the original branch order).
+    if "keep" in m or "zachow" in m:
+        mode = "keep"
+    elif "naprzem" in m or "alternate" in m:
+        mode = "alternate"
+    elif "blok" in m or "block" in m:
+        mode = "block"
+    elif "paragraph" in m or "akapit" in m:
+        mode = "paragraph"
+    else:
+        mode = "alternate"
+    sentence_units = "sentence" in m or "zdani" in m
+    merge_short = "merge" in m or "łącz" in m
     log(f"Text diarization: method='{method}', speakers={speakers}, lines={len(lines)}")
 
+    # The distinct labels are known up front; build them once and index by
+    # i % len instead of formatting an f-string per unit.
+    spk_labels = [f"SPK{k + 1}" for k in range(max(1, speakers))]
+
     def label(i: int) -> str:
-        spk = (i % max(1, speakers)) + 1
-        return f"SPK{spk}"
+        return spk_labels[i % len(spk_labels)]
 
     # Keep existing tags if present
-    if "keep" in m or "zachow" in m:
+    if mode == "keep":
         out = []
         for ln in lines:
-            if re.match(r"^(spk|speaker)\s*\d+[:\-]\s*", ln, re.I):
+            if _SPK_TAG_RE.match(ln):
                 out.append(ln)
             else:
                 out.append(f"{label(len(out))}: {ln}")
@@ -385,50 +559,49 @@ def diarize_text_simple(text: str, speakers: int, method: str, log_cb=None, prog
         return {"kind": "diarized_text", "text": "\n".join(out)}
 
     def split_sentences(text_line: str):
-        parts = re.split(r"(?<=[\.\?\!])\s+", text_line.strip())
+        parts = _SENT_SPLIT_RE.split(text_line.strip())
         return [p.strip() for p in parts if p.strip()]
 
     # Units: lines or sentences
     units = []
-    if "sentence" in m or "zdani" in m:
+    if sentence_units:
         for ln in lines:
             units.extend(split_sentences(ln))
     else:
         units = list(lines)
 
     # Merge short units
-    if "merge" in m or "łącz" in m:
+    if merge_short:
+        # Length-tracked list + join: appending to a growing string is
+        # quadratic over long transcripts.
         merged = []
-        buf = ""
+        frag: list[str] = []
+        frag_len = 0
         for u in units:
-            if len(buf) < 40:
-                buf = (buf + " " + u).strip()
+            if frag_len < 40:
+                # Separators only sit between units, so the first one is free;
+                # frag_len must equal len(" ".join(frag)) to keep merge
+                # boundaries identical to the string-accumulator baseline.
+                frag_len += len(u) + 1 if frag else len(u)
+                frag.append(u)
             else:
-                merged.append(buf)
-                buf = u
-        if buf:
-            merged.append(buf)
+                merged.append(" ".join(frag))
+                frag = [u]
+                frag_len = len(u)
+        if frag:
+            merged.append(" ".join(frag))
         units = merged
         log(f"Text diarization: merged units -> {len(units)}")
 
     out = []
 
-    if ("naprzem" in m) or ("alternate" in m):
-        for i, u in enumerate(units):
-            out.append(f"{label(i)}: {u}")
-
-    elif ("blok" in m) or ("block" in m):
+    if mode == "block":
         block = max(1, len(units) // max(1, speakers))
-        spk = 1
-        count = 0
-        for u in units:
-            out.append(f"SPK{spk}: {u}")
-            count += 1
-            if count >= block and spk < speakers:
-                spk += 1
-                count = 0
+        last = len(spk_labels) - 1
+        for i, u in enumerate(units):
+            out.append(f"{spk_labels[min(last, i // block)]}: {u}")
 
-    elif "paragraph" in m or "akapit" in m:
+    elif mode == "paragraph":
         i = 0
         spk = 1
         while i < len(units):
@@ -481,64 +654,110 @@ def diarize_voice_whisper_pyannote(
     except Exception as e:
         raise RuntimeError("Missing 'openai-whisper'. Install: pip install openai-whisper") from e
 
-    wmodel = whisper.load_model(model)
-    lang = None if language == "auto" else language
-    if log_cb:
-        log_cb("Whisper: transcribe with segments")
-    if progress_cb:
-        progress_cb(5)
-
-    wres = wmodel.transcribe(audio_path, language=lang, verbose=False)
-    segments = wres.get("segments") or []
-
-    if progress_cb:
-        progress_cb(35)
-
     # --- pyannote ---
     from pyannote.audio import Pipeline
 
     if not hf_token:
         raise RuntimeError("HF token missing. Set it in the app settings.")
 
-    if log_cb:
-        log_cb("pyannote: load speaker-diarization pipeline (auto-download if missing)")
-    pipeline = _load_pyannote_pipeline(Pipeline, hf_token, log_cb)
-
+    lang = None if language == "auto" else language
     if progress_cb:
-        progress_cb(45)
+        progress_cb(5)
 
-    if log_cb:
-        log_cb("pyannote: diarizing file (PCM WAV -> in-memory waveform)")
+    def _decode_shared_waveform():
+        """Decode the input once for both stages.
 
-    # Always stabilize input to avoid sample-count mismatch and pyannote internal decoding.
-    wav_path = _convert_to_pcm_wav_16k_mono(audio_path, log_cb=log_cb)
-    try:
+        Whisper and pyannote each run their own ffmpeg decode + resample over
+        the full file otherwise; for long recordings that is a duplicated
+        full pass. Returns (mono_np, waveform_tensor, sample_rate) or None
+        when the decode deps are unavailable (both stages then fall back to
+        their own loading).
+        """
         try:
+            import numpy as np
             import torch
             import soundfile as sf
         except Exception as e:
+            if log_cb:
+                log_cb(f"shared decode unavailable ({e}); stages will load audio separately")
+            return None
+
+        # Always stabilize input to avoid sample-count mismatch and pyannote internal decoding.
+        wav_path = _convert_to_pcm_wav_16k_mono(audio_path, log_cb=log_cb)
+        try:
+            audio_np, sr = sf.read(wav_path, dtype="float32", always_2d=True)  # (time, channels)
+        finally:
+            try:
+                os.unlink(wav_path)
+            except Exception:
+                pass
+
+        waveform = torch.from_numpy(audio_np.T)  # -> (channels, time)
+        mono = np.ascontiguousarray(audio_np[:, 0])
+        return mono, waveform, int(sr)
+
+    shared = _decode_shared_waveform()
+
+    def _whisper_job():
+        wmodel = _load_whisper_model_cached(whisper, model)
+        dev = _best_torch_device()
+        fp16 = dev is not None and dev.type == "cuda"
+        if log_cb:
+            log_cb(f"Whisper: transcribe with segments (device={dev.type if dev else 'cpu'}, fp16={fp16})")
+        if shared is not None:
+            return wmodel.transcribe(shared[0], language=lang, verbose=False, fp16=fp16)
+        return wmodel.transcribe(audio_path, language=lang, verbose=False, fp16=fp16)
+
+    def _pyannote_job():
+        if log_cb:
+            log_cb("pyannote: load speaker-diarization pipeline (auto-download if missing)")
+        pipeline = _load_pyannote_pipeline(Pipeline, hf_token, log_cb)
+
+        if log_cb:
+            log_cb("pyannote: diarizing file (PCM WAV -> in-memory waveform)")
+
+        if shared is None:
             raise RuntimeError(
                 "Missing deps for robust pyannote audio loading. "
                 "Install: pip install soundfile (and ensure torch is installed)."
-            ) from e
-
-        audio_np, sr = sf.read(wav_path, dtype="float32", always_2d=True)  # (time, channels)
-        waveform = torch.from_numpy(audio_np.T)  # -> (channels, time)
+            )
 
+        _, waveform, sr = shared
         file_dict = {
             "waveform": waveform,
-            "sample_rate": int(sr),
+            "sample_rate": sr,
             "uri": os.path.basename(audio_path),
-            "duration": float(waveform.shape[1]) / float(sr) if int(sr) > 0 else None,
+            "duration": float(waveform.shape[1]) / float(sr) if sr > 0 else None,
         }
 
-        diar = pipeline(file_dict)
+        return pipeline(file_dict)
 
-    finally:
-        try:
-            os.unlink(wav_path)
-        except Exception:
-            pass
+    try:
+        import torch
+        have_cuda = torch.cuda.is_available()
+    except Exception:
+        have_cuda = False
+
+    if have_cuda:
+        # Both stages would contend for the same GPU — keep them serial there.
+        wres = _whisper_job()
+        if progress_cb:
+            progress_cb(35)
+        diar = _pyannote_job()
+    else:
+        # On CPU both stages release the GIL inside torch/whisper C code, so
+        # running them side by side roughly costs max(t_whisper, t_pyannote).
+        if log_cb:
+            log_cb("Running Whisper and pyannote concurrently (CPU)")
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_whisper = ex.submit(_whisper_job)
+            f_pyannote = ex.submit(_pyannote_job)
+            wres = f_whisper.result()
+            if progress_cb:
+                progress_cb(35)
+            diar = f_pyannote.result()
+
+    segments = wres.get("segments") or []
 
     if progress_cb:
         progress_cb(80)
@@ -569,26 +788,88 @@ def diarize_voice_whisper_pyannote(
     if log_cb:
         log_cb(f"pyannote: found {len(turns)} speaker turns")
 
-    def overlap(a0, a1, b0, b1):
-        return max(0.0, min(a1, b1) - max(a0, b0))
+    # Sorted sweep instead of scanning every turn per segment (O((N+M) log M)
+    # rather than O(N*M); long meetings have thousands of segments and hundreds
+    # of turns). For each segment, only turns starting before its end can
+    # overlap; we walk backwards from that cut and stop as soon as no earlier
+    # turn can still reach into the segment (prefix max of turn ends).
+    turns.sort(key=lambda t: t[0])
 
-    out_lines = []
+    seg_list = []
     for seg in segments:
         s0 = float(seg.get("start", 0.0))
         s1 = float(seg.get("end", 0.0))
         txt = (seg.get("text") or "").strip()
-        if not txt:
-            continue
-
-        best_spk = "UNKNOWN"
-        best_ov = 0.0
-        for t0, t1, spk in turns:
-            ov = overlap(s0, s1, t0, t1)
-            if ov > best_ov:
-                best_ov = ov
-                best_spk = spk
-
-        out_lines.append(f"[{s0:.2f}-{s1:.2f}] {best_spk}: {txt}")
+        if txt:
+            seg_list.append((s0, s1, txt))
+
+    # Vectorized overlap join: the full segment x turn overlap matrix runs at
+    # memory bandwidth in C. Rows are tiled so the intermediate stays at a few
+    # MB regardless of segment count; falls back to the bisect sweep below if
+    # numpy is unavailable.
+    speakers = None
+    try:
+        import numpy as np
+        if seg_list and turns:
+            t0a = np.fromiter((t[0] for t in turns), dtype=np.float64, count=len(turns))
+            t1a = np.fromiter((t[1] for t in turns), dtype=np.float64, count=len(turns))
+            labels = [t[2] for t in turns]
+            s0a = np.fromiter((s[0] for s in seg_list), dtype=np.float64, count=len(seg_list))
+            s1a = np.fromiter((s[1] for s in seg_list), dtype=np.float64, count=len(seg_list))
+
+            speakers = []
+            step = 2048
+            for i in range(0, len(seg_list), step):
+                ov = np.maximum(
+                    0.0,
+                    np.minimum(s1a[i:i + step, None], t1a[None, :])
+                    - np.maximum(s0a[i:i + step, None], t0a[None, :]),
+                )
+                best = ov.argmax(axis=1)
+                best_ov = ov[np.arange(best.shape[0]), best]
+                speakers.extend(
+                    labels[j] if o > 0.0 else "UNKNOWN"
+                    for j, o in zip(best, best_ov)
+                )
+        elif seg_list:
+            speakers = ["UNKNOWN"] * len(seg_list)
+    except Exception:
+        speakers = None
+
+    if speakers is None:
+        # Sorted sweep: for each segment, only turns starting before its end
+        # can overlap; walk backwards from that cut and stop as soon as no
+        # earlier turn can still reach into the segment (prefix max of ends).
+        turn_starts = [t[0] for t in turns]
+        max_end_prefix = []
+        running_end = 0.0
+        for _, t1, _ in turns:
+            running_end = max(running_end, t1)
+            max_end_prefix.append(running_end)
+
+        speakers = []
+        for s0, s1, _txt in seg_list:
+            best_spk = "UNKNOWN"
+            best_ov = 0.0
+            i = bisect.bisect_right(turn_starts, s1)
+            while i > 0:
+                i -= 1
+                if max_end_prefix[i] <= s0:
+                    break
+                t0, t1, spk = turns[i]
+                ov = min(s1, t1) - max(s0, t0)
+                # >= so the walk (high index -> low) resolves equal-overlap
+                # ties to the earliest-starting turn, matching the argmax in
+                # the vectorized path; zero overlap must not beat UNKNOWN.
+                if ov > 0.0 and ov >= best_ov:
+                    best_ov = ov
+                    best_spk = spk
+            speakers.append(best_spk)
+
+    out_lines = [
+        f"[{s0:.2f}-{s1:.2f}] {spk}: {txt}"
+        for (s0, s1, txt), spk in zip(seg_list, speakers)
+    ]
 
     # Join diarized segments into final text.
     text = "\n".join(out_lines) if out_lines else (wres.get("text") or "").strip()
@@ -614,7 +895,6 @@ def diarize_voice_whisper_pyannote_safe(
     """
     import json
     import os
-    import re
     import subprocess
     import sys
     import threading
@@ -649,7 +929,6 @@ def diarize_voice_whisper_pyannote_safe(
             text=False,  # IMPORTANT: binary mode for live tqdm (\r) streaming
             bufsize=0,
             cwd=os.path.dirname(os.path.dirname(__file__)),  # project root
-            env=os.environ.copy(),
         )
 
         stderr_q: "queue.Queue[str]" = queue.Queue()
@@ -684,8 +963,22 @@ def diarize_voice_whisper_pyannote_safe(
                     if ln.strip():
                         stderr_q.put(ln)
 
+        out_chunks: list[bytes] = []
+
+        def _stdout_reader(p: subprocess.Popen) -> None:
+            # Drain stdout concurrently: the final JSON can exceed the OS pipe
+            # buffer, and a worker blocked on that write never exits (the same
+            # deadlock whisper_transcribe_safe already guards against).
+            while True:
+                chunk = p.stdout.read(65536)  # type: ignore[union-attr]
+                if not chunk:
+                    break
+                out_chunks.append(chunk)
+
         t = threading.Thread(target=_stderr_reader, args=(proc,), daemon=True)
         t.start()
+        t_out = threading.Thread(target=_stdout_reader, args=(proc,), daemon=True)
+        t_out.start()
 
         # Pump stderr lines LIVE while process runs
         while proc.poll() is None:
@@ -703,11 +996,11 @@ def diarize_voice_whisper_pyannote_safe(
             except queue.Empty:
                 break
 
-        # Now read stdout (JSON) after worker ends
-        out_bytes = b""
-        if proc.stdout:
-            out_bytes = proc.stdout.read() or b""
-        out = out_bytes.decode("utf-8", errors="replace")
+        # Join the pumps, then assemble stdout (JSON) collected while running
+        proc.wait()
+        t.join(timeout=2)
+        t_out.join(timeout=2)
+        out = b"".join(out_chunks).decode("utf-8", errors="replace")
         err = "\n".join(stderr_all)
 
         # If worker failed, return a helpful error
@@ -722,9 +1015,12 @@ def diarize_voice_whisper_pyannote_safe(
             )
             return {"kind": "diarized_voice", "text": fail_text, "ok": False}
 
-        # Worker succeeded but stdout might be empty or contain non-JSON
-        out_str = (out or "").strip()
-        if not out_str:
+        # Worker succeeded but stdout might be empty or contain non-JSON.
+        # raw_decode skips any prefix noise and stops at the end of the outer
+        # object, so pollution around the JSON is harmless and the buffer is
+        # never copied by strip().
+        idx = out.find("{")
+        if idx < 0:
             tail = (err or "").strip().splitlines()[-15:]
             tail_txt = "\n".join(tail)
             fail_text = (
@@ -734,16 +1030,7 @@ def diarize_voice_whisper_pyannote_safe(
             )
             return {"kind": "diarized_voice", "text": fail_text, "ok": False}
 
-        # Try parse JSON
-        try:
-            data = json.loads(out_str)
-        except Exception:
-            # Try to recover: find last JSON object in stdout (in case something polluted stdout)
-            m = list(re.finditer(r"\{[\s\S]*\}\s*$", out_str))
-            if m:
-                data = json.loads(m[-1].group(0))
-            else:
-                raise
+        data, _end = json.JSONDecoder().raw_decode(out, idx)
 
         if not isinstance(data, dict):
             return {"kind": "diarized_voice", "text": str(data), "ok": True}
@@ -10,6 +10,9 @@ from PySide6.QtWidgets import (
     QCheckBox, QPushButton, QLineEdit, QFileDialog, QLabel, QMessageBox
 )
 
+# Characters invalid on Windows and problematic on Linux, mapped to "_".
+_BAD_FN_CHARS = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
 @dataclass
 class ReportDialogResult:
     include_logs: bool
@@ -171,8 +174,7 @@ class ReportDialog(QDialog):
         name = os.path.splitext(name)[0]
 
         # Replace characters that are invalid on Windows and problematic on Linux.
-        for ch in ['<', '>', ':', '"', '/', '\\', '|', '?', '*']:
-            name = name.replace(ch, "_")
+        name = name.translate(_BAD_FN_CHARS)
 
         # Avoid trailing dots/spaces (Windows) and empty result.
         name = name.strip(" .\t\n\r")
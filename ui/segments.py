@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Optional, Tuple, Dict, List, Callable
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Callable
 
 from PySide6.QtCore import Qt, Signal, QTimer, QUrl, QEvent
 from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor
@@ -28,18 +29,59 @@ _SPK_AFTER_TS_RE = re.compile(
     r"^\s*(?P<spk>[^:\[\]]{1,64}):\s*(?P<txt>.*)$"
 )
 
+# Speaker label in either position, scanned over the whole document in one
+# engine invocation: group 1 is "Speaker:" at line start (timestamp or not),
+# group 2 is "[ts] Speaker:".
+_COMBINED_SPK_RE = re.compile(
+    r"^(?:\s*([^:\[\]\n]{1,64}):|\[[^\]\n]+\]\s*([^:\[\]\n]{1,64}):)",
+    re.MULTILINE,
+)
+
+# Bound methods of the compiled patterns: saves an attribute lookup per call
+# in the per-line parse path.
+_TS_SEARCH = _TS_BRACKET_RE.search
+_SPK_MATCH = _SPK_PREFIX_RE.match
+_SPK_AFTER_MATCH = _SPK_AFTER_TS_RE.match
+
+# Drops CR and turns LF into a space in one C-level pass (segments must stay
+# one line each or playback mapping breaks).
+_NL_TBL = str.maketrans({"\r": "", "\n": " "})
+
 
 def _parse_time_to_seconds(s: str) -> Optional[float]:
     s = (s or "").strip()
     s = s.replace(',', '.')
     if not s:
         return None
-    # float seconds format
-    if re.fullmatch(r"\d+(?:\.\d+)?", s):
-        try:
-            return float(s)
-        except Exception:
-            return None
+    # Fast path: the grammar is tiny (plain seconds or H:MM:SS[.ms]) and this
+    # runs twice per parsed line, so a str.split/isdigit scan beats regexes.
+    parts = s.split(":")
+    if len(parts) == 1:
+        # Plain seconds: let float() do the parsing directly — it is faster
+        # than pre-validating. The leading-digit guard keeps inf/nan out, and
+        # the bracket regex already restricts the alphabet to [0-9:.,].
+        if s[:1].isdigit():
+            try:
+                return float(s)
+            except ValueError:
+                pass
+        return None
+    if len(parts) == 3:
+        h, mi, sec = parts
+        sec_i, dot, frac = sec.partition(".")
+        if (
+            h.isdecimal() and len(h) <= 2
+            and mi.isdecimal() and len(mi) == 2
+            and sec_i.isdecimal() and len(sec_i) == 2
+            and (not dot or (frac.isdecimal() and len(frac) <= 3))
+        ):
+            ms = int(frac.ljust(3, "0")[:3]) if dot else 0
+            return int(h) * 3600 + int(mi) * 60 + int(sec_i) + ms / 1000.0
+    return _parse_time_to_seconds_slow(s)
+
+
+def _parse_time_to_seconds_slow(s: str) -> Optional[float]:
+    """Regex fallback for colon formats the fast scanner does not recognize."""
     # HH:MM:SS(.ms)
     m = re.fullmatch(r"(?P<h>\d{1,2}):(?P<m>\d{2}):(?P<sec>\d{2})(?:\.(?P<ms>\d{1,3}))?", s)
     if not m:
@@ -52,7 +94,7 @@ def _parse_time_to_seconds(s: str) -> Optional[float]:
     return float(h * 3600 + mi * 60 + sec) + ms / 1000.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Segment:
     block_number: int
     ts_bracket: str
@@ -69,23 +111,40 @@ def parse_segment_line(line: str, block_number: int = 0) -> Optional[Segment]:
       1) [00:00:01.230 - 00:00:03.900] some text
       2) [12.34-15.67] SPEAKER_00: some text
       3) SPEAKER_00: [00:00:01.230 - 00:00:03.900] some text
+
+    Parsing is pure in the line text, so results are memoized; the hot callers
+    (mouse tracking, speaker coloring) mostly re-parse unchanged lines.
     """
+    seg = _parse_segment_line_uncached(line)
+    if seg is None:
+        return None
+    # Cached instances are shared; hand out a copy with the caller's block.
+    return replace(seg, block_number=block_number)
+
+
+@lru_cache(maxsize=4096)
+def _parse_segment_line_uncached(line: str) -> Optional[Segment]:
     raw = (line or "").rstrip("\n")
     if not raw.strip():
         return None
 
+    # A segment always carries a [start - end] bracket; a substring check is
+    # far cheaper than the regexes below for plain prose or comment lines.
+    if "[" not in raw or "]" not in raw:
+        return None
+
     speaker = ""
     speaker_position = "none"
     rest = raw.strip()
 
     # Detect speaker before timestamp (format 3)
-    m0 = _SPK_PREFIX_RE.match(rest)
-    if m0 and _TS_BRACKET_RE.search(m0.group("rest") or ""):
+    m0 = _SPK_MATCH(rest)
+    if m0 and _TS_SEARCH(m0.group("rest") or ""):
         speaker = (m0.group("spk") or "").strip()
         speaker_position = "before_ts"
         rest = (m0.group("rest") or "").strip()
 
-    m = _TS_BRACKET_RE.search(rest)
+    m = _TS_SEARCH(rest)
     if not m:
         return None
 
@@ -100,7 +159,7 @@ def parse_segment_line(line: str, block_number: int = 0) -> Optional[Segment]:
 
     # If speaker not set before timestamp, try speaker after timestamp (format 2)
     if not speaker and after:
-        m1 = _SPK_AFTER_TS_RE.match(after)
+        m1 = _SPK_AFTER_MATCH(after)
         if m1:
             speaker = (m1.group("spk") or "").strip()
             after = (m1.group("txt") or "").strip()
@@ -118,7 +177,7 @@ def parse_segment_line(line: str, block_number: int = 0) -> Optional[Segment]:
         a, b = b, a
 
     return Segment(
-        block_number=block_number,
+        block_number=0,
         ts_bracket=ts_bracket,
         start_s=float(a),
         end_s=float(b),
@@ -140,23 +199,108 @@ class SegmentTextEdit(QTextEdit):
         self._hover_seg: Optional[Segment] = None
 
         # Base selections are used for features like "color by speaker".
-        # Hover selection is layered on top.
+        # Hover selection is layered on top. Kept per block so edits can
+        # update just the touched lines instead of rebuilding everything.
         self._base_selections: list[QTextEdit.ExtraSelection] = []
+        # Reusable buffer: base selections plus one trailing hover slot, so
+        # mouse moves don't copy the whole selection list.
+        self._sels_buf: list = [None]
+        # (hover block, identity of the base list) last pushed into Qt; lets
+        # redundant _apply_selections calls skip the setExtraSelections relayout.
+        self._last_applied_key: Optional[tuple] = None
+        self._block_sel_by_bn: dict[int, QTextEdit.ExtraSelection] = {}
+        self._known_block_count: int = self.document().blockCount()
+
+        # Parsed segment per block (None for non-segment lines). Kept fresh by
+        # the contentsChange pathway and filled lazily on first hover, so the
+        # mouse-event hot path is a dict lookup instead of a regex parse.
+        self._seg_by_bn: dict[int, Optional[Segment]] = {}
 
         self._color_by_speaker: bool = False
         self._speaker_color_map: dict[str, object] = {}
-
-        # Recompute speaker colors when text changes (only if enabled)
-        self.textChanged.connect(self._maybe_recompute_speaker_coloring)
+        # Set when a full recompute is requested while the widget is hidden;
+        # showEvent runs the deferred pass.
+        self._coloring_dirty: bool = False
+
+        # Color math caches. Tints depend on the palette and the speaker
+        # index, foreground choice only on the background RGB, so both are
+        # pure in their keys and never need invalidating.
+        self._tint_cache: dict[tuple, QColor] = {}
+        self._fg_cache: dict[int, QColor] = {}
+
+        # Coalesce bursts of structural edits (paste, multi-line replace) into
+        # one full recompute instead of one per contentsChange signal.
+        self._recolor_timer = QTimer(self)
+        self._recolor_timer.setSingleShot(True)
+        self._recolor_timer.setInterval(60)
+        self._recolor_timer.timeout.connect(self._recompute_speaker_coloring)
+
+        # Recompute speaker colors when text changes (only if enabled).
+        # contentsChange carries the edit position, so unlike textChanged it
+        # allows re-parsing only the affected blocks.
+        self.document().contentsChange.connect(self._on_contents_change)
 
     # ---------- Speaker coloring (diarization view) ----------
     def enable_speaker_coloring(self, enabled: bool) -> None:
         self._color_by_speaker = bool(enabled)
         self._recompute_speaker_coloring()
 
-    def _maybe_recompute_speaker_coloring(self) -> None:
+    def _on_contents_change(self, pos: int, removed: int, added: int) -> None:
+        doc = self.document()
+        if doc.blockCount() != self._known_block_count:
+            # Lines were inserted/removed: block numbers shifted. The per-block
+            # parse cache is stale either way; with coloring on, rebuild too
+            # (debounced so paste storms collapse into one pass).
+            self._seg_by_bn.clear()
+            if self._color_by_speaker:
+                self._recolor_timer.start()
+            else:
+                self._known_block_count = doc.blockCount()
+            return
+        start_bn = doc.findBlock(pos).blockNumber()
+        end_block = doc.findBlock(pos + added)
+        end_bn = end_block.blockNumber() if end_block.isValid() else doc.blockCount() - 1
+        for bn in range(start_bn, end_bn + 1):
+            self._update_block_coloring(bn)
         if self._color_by_speaker:
-            self._recompute_speaker_coloring()
+            self._rebuild_base_selections()
+            self._apply_selections()
+
+    def _update_block_coloring(self, bn: int) -> None:
+        """Re-parse one block, refresh its cached segment and stored selection."""
+        doc = self.document()
+        block = doc.findBlockByNumber(bn)
+        if not block.isValid():
+            self._seg_by_bn.pop(bn, None)
+            self._block_sel_by_bn.pop(bn, None)
+            return
+        seg = parse_segment_line(block.text(), bn)
+        self._seg_by_bn[bn] = seg
+        spk = seg.speaker.strip() if seg and seg.speaker else ""
+        if not spk or not self._color_by_speaker:
+            self._block_sel_by_bn.pop(bn, None)
+            return
+        color = self._speaker_color_map.get(spk)
+        if color is None:
+            # New speaker typed mid-session: append it to the stable mapping.
+            color = self._speaker_tint(len(self._speaker_color_map))
+            self._speaker_color_map[spk] = color
+        self._block_sel_by_bn[bn] = self._make_block_selection(block, color)
+
+    def _make_block_selection(self, block, color) -> QTextEdit.ExtraSelection:
+        cur = QTextCursor(block)
+        cur.select(QTextCursor.BlockUnderCursor)
+        fmt = QTextCharFormat()
+        fmt.setBackground(color)
+        fmt.setForeground(self._best_text_for_bg(color))
+        sel = QTextEdit.ExtraSelection()
+        sel.cursor = cur
+        sel.format = fmt
+        return sel
+
+    def _rebuild_base_selections(self) -> None:
+        self._base_selections = [self._block_sel_by_bn[bn] for bn in sorted(self._block_sel_by_bn)]
+        self._sels_buf = self._base_selections + [None]
 
     def _blend(self, c1, c2, alpha: float):
         a = max(0.0, min(1.0, float(alpha)))
@@ -178,6 +322,11 @@ class SegmentTextEdit(QTextEdit):
 
     def _best_text_for_bg(self, bg: QColor) -> QColor:
         """Pick black/white text for best contrast on the given background."""
+        key = bg.rgb()
+        cached = self._fg_cache.get(key)
+        if cached is not None:
+            return cached
+
         lum = self._rel_luminance(bg)
 
         def _contrast(l1: float, l2: float) -> float:
@@ -187,15 +336,23 @@ class SegmentTextEdit(QTextEdit):
 
         c_black = _contrast(lum, 0.0)
         c_white = _contrast(lum, 1.0)
-        return QColor(0, 0, 0) if c_black >= c_white else QColor(255, 255, 255)
+        out = QColor(0, 0, 0) if c_black >= c_white else QColor(255, 255, 255)
+        self._fg_cache[key] = out
+        return out
 
     def _speaker_tint(self, index: int):
         """Return a subtle per-speaker background that stays readable in light/dark themes."""
         base = self.palette().base().color()
+        hi_color = self.palette().highlight().color()
+        key = (base.rgb(), hi_color.rgb(), index)
+        cached = self._tint_cache.get(key)
+        if cached is not None:
+            return cached
+
         base_v = base.toHsv().value()
         is_dark = base_v < 128
 
-        hi = self.palette().highlight().color().toHsv()
+        hi = hi_color.toHsv()
         hue = hi.hue() if hi.hue() >= 0 else 210
         h = (hue + (index * 37)) % 360
         sat = max(35, min(110, hi.saturation() if hi.saturation() >= 0 else 85))
@@ -209,51 +366,69 @@ class SegmentTextEdit(QTextEdit):
             alpha = 0.14
 
         tint = QColor.fromHsv(int(h), int(sat), int(val))
-        return self._blend(base, tint, alpha)
+        out = self._blend(base, tint, alpha)
+        self._tint_cache[key] = out
+        return out
 
     def _recompute_speaker_coloring(self) -> None:
-        # Build stable mapping: speaker -> tint
-        speakers: list[str] = []
-        for i, line in enumerate((self.toPlainText() or "").splitlines()):
-            seg = parse_segment_line(line, i)
-            if seg and seg.speaker:
-                spk = seg.speaker.strip()
-                if spk and spk not in speakers:
-                    speakers.append(spk)
-
+        # Don't color what isn't rendered: while the widget (e.g. a background
+        # tab) is hidden, just mark the pass pending for showEvent.
+        if not self.isVisible():
+            self._coloring_dirty = True
+            return
+        self._coloring_dirty = False
+        # Coalesce repaints: the rebuild applies selections (and callers may
+        # layer hover on top), so hold painting until everything is in place.
+        self.setUpdatesEnabled(False)
+        try:
+            self._recompute_speaker_coloring_impl()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _recompute_speaker_coloring_impl(self) -> None:
+        # Single parse pass: walk the document's block linked list (begin/next
+        # is O(1) per step, findBlockByNumber is O(N) per call) and collect
+        # (block number, block, segment) once, then derive the stable
+        # speaker -> tint mapping from it in document order. The same pass
+        # refills the per-block cache the mouse handlers read.
+        doc = self.document()
+        self._known_block_count = doc.blockCount()
+        parsed: list[tuple[int, object, Segment]] = []
+        self._seg_by_bn = {}
+        block = doc.begin()
+        bn = 0
+        while block.isValid():
+            seg = parse_segment_line(block.text(), bn)
+            self._seg_by_bn[bn] = seg
+            if seg and seg.speaker.strip():
+                parsed.append((bn, block, seg))
+            block = block.next()
+            bn += 1
+
+        speakers = list(dict.fromkeys(seg.speaker.strip() for _, _, seg in parsed))
         self._speaker_color_map = {spk: self._speaker_tint(idx) for idx, spk in enumerate(speakers)}
 
-        # Prepare base selections (one per block)
-        sels: list[QTextEdit.ExtraSelection] = []
-        doc = self.document()
-        for bn in range(doc.blockCount()):
-            block = doc.findBlockByNumber(bn)
-            if not block.isValid():
-                continue
-            line = block.text()
-            seg = parse_segment_line(line, bn)
-            if not seg or not seg.speaker:
-                continue
+        # Prepare base selections (one per parsed block)
+        self._block_sel_by_bn = {}
+        for bn, block, seg in parsed:
             color = self._speaker_color_map.get(seg.speaker.strip())
             if color is None:
                 continue
-            cur = QTextCursor(block)
-            cur.select(QTextCursor.BlockUnderCursor)
-            fmt = QTextCharFormat()
-            fmt.setBackground(color)
-            fmt.setForeground(self._best_text_for_bg(color))
-            sel = QTextEdit.ExtraSelection()
-            sel.cursor = cur
-            sel.format = fmt
-            sels.append(sel)
-
-        self._base_selections = sels
+            self._block_sel_by_bn[bn] = self._make_block_selection(block, color)
+
+        self._rebuild_base_selections()
         self._apply_selections()
 
     # ---------- Hover highlight layering ----------
     def _apply_selections(self) -> None:
-        # Apply base selections plus hovered selection (if any)
-        sels = list(self._base_selections)
+        # Apply base selections plus hovered selection (if any).
+        # setExtraSelections copies into Qt, so the Python list is reused:
+        # the hover selection only ever patches the trailing buffer slot.
+        key = (self._hover_block, id(self._base_selections))
+        if key == self._last_applied_key:
+            return
+        hover_sel = None
         if self._hover_block is not None:
             doc = self.document()
             block = doc.findBlockByNumber(self._hover_block)
@@ -271,8 +446,13 @@ class SegmentTextEdit(QTextEdit):
                 hover_sel = QTextEdit.ExtraSelection()
                 hover_sel.cursor = cur
                 hover_sel.format = fmt
-                sels.append(hover_sel)
-        self.setExtraSelections(sels)
+
+        if hover_sel is None:
+            self.setExtraSelections(self._base_selections)
+        else:
+            self._sels_buf[-1] = hover_sel
+            self.setExtraSelections(self._sels_buf)
+        self._last_applied_key = key
 
     def changeEvent(self, event) -> None:  # type: ignore[override]
         # When theme/palette changes, recompute selections so text stays readable
@@ -283,6 +463,9 @@ class SegmentTextEdit(QTextEdit):
             et = None
 
         if et in (QEvent.PaletteChange, QEvent.StyleChange):
+            # Selection formats depend on the palette; force a re-apply even if
+            # the (hover, base) key is unchanged.
+            self._last_applied_key = None
             if self._color_by_speaker:
                 self._recompute_speaker_coloring()
             else:
@@ -290,6 +473,19 @@ class SegmentTextEdit(QTextEdit):
 
         return super().changeEvent(event)
 
+    def _segment_for_block(self, block, bn: int) -> Optional[Segment]:
+        """Cached per-block parse; fills the cache lazily on first lookup."""
+        if bn in self._seg_by_bn:
+            return self._seg_by_bn[bn]
+        seg = parse_segment_line(block.text(), bn)
+        self._seg_by_bn[bn] = seg
+        return seg
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        if self._coloring_dirty:
+            self._recompute_speaker_coloring()
+        return super().showEvent(event)
+
     def _highlight_block(self, block_number: Optional[int]) -> None:
         self._hover_block = block_number
         self._apply_selections()
@@ -305,8 +501,10 @@ class SegmentTextEdit(QTextEdit):
         cur = self.cursorForPosition(event.pos())
         block = cur.block()
         bn = block.blockNumber()
-        line = block.text()
-        seg = parse_segment_line(line, bn)
+        if bn == self._hover_block:
+            # Still on the already-highlighted block — nothing to look up.
+            return super().mouseMoveEvent(event)
+        seg = self._segment_for_block(block, bn)
         if seg is None:
             if self._hover_block is not None:
                 self._hover_block = None
@@ -327,7 +525,7 @@ class SegmentTextEdit(QTextEdit):
         cur = self.cursorForPosition(event.pos())
         block = cur.block()
         bn = block.blockNumber()
-        seg = parse_segment_line(block.text(), bn)
+        seg = self._segment_for_block(block, bn)
         if seg is not None:
             self.segmentDoubleClicked.emit(seg)
         return super().mouseDoubleClickEvent(event)
@@ -344,7 +542,7 @@ class SegmentTextEdit(QTextEdit):
             return
 
         # Keep segments one-line: newlines would create extra blocks and break playback mapping.
-        safe_line = (new_line or "").replace("\r", "").replace("\n", " ").strip()
+        safe_line = (new_line or "").translate(_NL_TBL).strip()
 
         cur = QTextCursor(doc)
         cur.setPosition(block.position())
@@ -387,6 +585,9 @@ class SegmentEditDialog(QDialog):
         self._timer = QTimer(self)
         self._timer.setInterval(200)
         self._timer.timeout.connect(self._sync_slider)
+        # Tick only while audio is actually advancing; paused/stopped states
+        # get a single sync instead of a 200 ms wakeup loop.
+        self.player.playbackStateChanged.connect(self._on_playback_state)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(12, 12, 12, 12)
@@ -476,6 +677,13 @@ class SegmentEditDialog(QDialog):
         m, s = divmod(s, 60)
         return f"{m:02d}:{s:02d}"
 
+    def _on_playback_state(self, state) -> None:
+        if state == QMediaPlayer.PlayingState:
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self._sync_slider()
+
     def _sync_slider(self) -> None:
         pos = int(self.player.position())
         start_ms = int(self.seg.start_s * 1000)
@@ -510,7 +718,6 @@ class SegmentEditDialog(QDialog):
         if pos < start_ms or pos > end_ms:
             self.player.setPosition(start_ms)
         self.player.play()
-        self._timer.start()
 
     def stop(self) -> None:
         try:
@@ -519,13 +726,13 @@ class SegmentEditDialog(QDialog):
             pass
         start_ms = int(self.seg.start_s * 1000)
         self.player.setPosition(start_ms)
-        self._timer.start()
+        self._sync_slider()
+
     def build_new_line(self) -> str:
         speaker = (self.spk_edit.text() or "").strip()
-        text = (self.txt_edit.toPlainText() or "").strip()
-        # Keep it as a single line to preserve the 1-line-per-segment convention.
-        text = re.sub(r"\s*\n\s*", " ", text)
-        text = re.sub(r"\s{2,}", " ", text).strip()
+        # Keep it as a single line to preserve the 1-line-per-segment convention:
+        # split/join collapses newlines and runs of whitespace in one pass.
+        text = " ".join((self.txt_edit.toPlainText() or "").split())
         ts = self.seg.ts_bracket
 
         # Reconstruct respecting speaker position
@@ -648,18 +855,17 @@ class SpeakerNamesPanel(QWidget):
         self.btn_apply.setText(self.t("btn_apply"))
         self.hint.setText(self.t("speaker_names_hint"))
 
-    def _collect_speakers_from_text(self, text: str) -> List[str]:
-        speakers: set[str] = set()
-        for i, line in enumerate((text or "").splitlines()):
-            seg = parse_segment_line(line, i)
-            if seg and seg.speaker:
-                speakers.add(seg.speaker)
-            else:
-                # also support lines without timestamps: "SPEAKER_00: text"
-                m = _SPK_PREFIX_RE.match(line.strip())
-                if m:
-                    speakers.add((m.group("spk") or "").strip())
-        return sorted(speakers)
+    def _collect_speakers_from_text(self, text: str) -> set[str]:
+        # One combined pass over the whole buffer instead of a Python-level
+        # line loop with several regex calls per line. Lines without
+        # timestamps ("SPEAKER_00: text") are covered by the first branch.
+        # Returns the raw set; the caller unions both panes and sorts once.
+        speakers = {
+            (m.group(1) or m.group(2)).strip()
+            for m in _COMBINED_SPK_RE.finditer(text or "")
+        }
+        speakers.discard("")
+        return speakers
 
     def refresh(self) -> None:
         # clear current fields
@@ -667,8 +873,8 @@ class SpeakerNamesPanel(QWidget):
             self.form.removeRow(0)
         self._edit_fields.clear()
 
-        speakers = set(self._collect_speakers_from_text(self.left.toPlainText()))
-        speakers |= set(self._collect_speakers_from_text(self.right.toPlainText()))
+        speakers = self._collect_speakers_from_text(self.left.toPlainText())
+        speakers |= self._collect_speakers_from_text(self.right.toPlainText())
         speakers_list = sorted(speakers)
 
         if not speakers_list:
@@ -692,22 +898,19 @@ class SpeakerNamesPanel(QWidget):
             QMessageBox.information(self, self.t("speaker_panel_title"), self.t("speaker_panel_no_changes"))
             return {}
 
+        # Replace only speaker labels (line-start or after timestamp).
+        # One combined alternation scans each document once instead of two
+        # re.sub passes per renamed speaker; longer labels go first so a label
+        # that prefixes another still wins.
+        pat = re.compile(
+            r"(^\s*|\]\s*)("
+            + "|".join(re.escape(old) for old in sorted(mapping, key=len, reverse=True))
+            + r")(?=:)",
+            re.MULTILINE,
+        )
+
         def _apply_to_text(text: str) -> str:
-            out = text
-            for old, new in mapping.items():
-                # Replace only speaker labels (line-start or after timestamp)
-                out = re.sub(
-                    rf"(^\s*){re.escape(old)}(?=:)",
-                    lambda m: (m.group(1) or "") + new,
-                    out,
-                    flags=re.MULTILINE,
-                )
-                out = re.sub(
-                    rf"(\]\s*){re.escape(old)}(?=:)",
-                    lambda m: (m.group(1) or "") + new,
-                    out,
-                )
-            return out
+            return pat.sub(lambda m: m.group(1) + mapping[m.group(2)], text)
 
         self.left.setPlainText(_apply_to_text(self.left.toPlainText()))
         self.right.setPlainText(_apply_to_text(self.right.toPlainText()))
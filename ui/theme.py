@@ -4,18 +4,28 @@
 
 from __future__ import annotations
 
+import sys
+import types
+
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Final, Optional, TYPE_CHECKING
 
-from PySide6.QtGui import QColor, QPalette
-from PySide6.QtWidgets import QApplication
+# Qt is imported lazily inside the palette builders: THEMES, default_theme()
+# and theme_stylesheet() are pure-string APIs and shouldn't pay the PySide6
+# shared-library load just for importing this module.
+if TYPE_CHECKING:
+    from PySide6.QtGui import QColor, QPalette
+    from PySide6.QtWidgets import QApplication
 
 
 # --------------------------------------------------------------------------------------
 # Public API expected by the app
 # --------------------------------------------------------------------------------------
 
-THEMES = [
+# Immutable tuple with interned names: later dict lookups on these exact
+# strings hit pointer equality, and accidental mutation fails loudly.
+THEMES: tuple[str, ...] = tuple(sys.intern(s) for s in (
     "Fusion Dark (Nord)",
     "Fusion Dark (Dracula)",
     "Fusion Dark (Graphite)",
@@ -25,7 +35,13 @@ THEMES = [
     "Fusion Light (Clean)",
     "Fusion Light (Blue)",
     "Fusion Light (Fluent 11)",
-]
+))
+
+
+# Name of the spec currently applied to the QApplication; reapplying the same
+# theme (settings-dialog Apply/OK) would otherwise force a full style
+# recalculation and repaint of every top-level widget.
+_CURRENT_THEME: Optional[str] = None
 
 
 def apply_theme(app: QApplication, theme: str) -> None:
@@ -35,27 +51,45 @@ def apply_theme(app: QApplication, theme: str) -> None:
       - Applies a matching QPalette (ensures readable text)
       - Applies QSS (gives the "effectful" look)
     """
-    theme = (theme or "").strip()
-    spec = _THEME_SPECS.get(theme, _THEME_SPECS["Fusion Dark (Nord)"])
+    global _CURRENT_THEME
+    spec = _resolve_spec(theme)
+    if spec.name == _CURRENT_THEME:
+        return
 
-    app.setStyle("Fusion")
+    if app.style().objectName().lower() != "fusion":
+        app.setStyle("Fusion")
     _apply_palette(app, spec.palette)
+    # _build_qss is memoized, so the same str object is handed to Qt every
+    # time a given theme comes back; re-applies are filtered out above, so the
+    # str -> QString (UTF-16) conversion happens once per actual switch.
     app.setStyleSheet(_build_qss(spec))
 
+    # Pixmaps rendered under the previous palette (icons, styled frames) would
+    # otherwise linger in Qt's global cache and be served with stale colors.
+    # Only reached when the theme actually changed, so no-op re-applies don't
+    # drop the cache.
+    from PySide6.QtGui import QPixmapCache
+    QPixmapCache.clear()
+
+    _CURRENT_THEME = spec.name
+
 
 def theme_stylesheet(theme: str) -> str:
     """Backwards-compatible helper if your code calls theme_stylesheet()."""
-    theme = (theme or "").strip()
-    spec = _THEME_SPECS.get(theme, _THEME_SPECS["Fusion Dark (Nord)"])
-    return _build_qss(spec)
+    return _build_qss(_resolve_spec(theme))
 
 
 # --------------------------------------------------------------------------------------
 # Theme specs
 # --------------------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaletteSpec:
+    # Fields stay as "#RRGGBB" strings: the QSS templates interpolate them
+    # verbatim, repeated literals (e.g. "#FFFFFF") are merged by the compiler
+    # at module scope, and _qcolor dedupes the QColor side by value — so an
+    # indexed color table would add an int->hex round trip without shrinking
+    # anything.
     mode: str  # "dark" | "light"
     window: str
     base: str
@@ -72,7 +106,7 @@ class PaletteSpec:
     border: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThemeSpec:
     name: str
     palette: PaletteSpec
@@ -206,7 +240,9 @@ _CLEAN = PaletteSpec(
 )
 
 
-_THEME_SPECS: Dict[str, ThemeSpec] = {
+# Read-only view: the spec table is static for the process; a MappingProxyType
+# guards against accidental mutation by callers.
+_THEME_SPECS: types.MappingProxyType = types.MappingProxyType({
     "Fusion Dark (Nord)": ThemeSpec(
         name="Fusion Dark (Nord)",
         palette=_NORD,
@@ -288,116 +324,121 @@ _THEME_SPECS: Dict[str, ThemeSpec] = {
         font_size_px=13,
         fluent=True,
     ),
-}
+})
+
+_DEFAULT_SPEC = _THEME_SPECS["Fusion Dark (Nord)"]
+
+# Lookup with interned keys plus lowercased aliases, so the per-call resolve
+# is a single dict hit for exact names and stays O(1) on sloppy input.
+_THEME_LOOKUP: Dict[str, ThemeSpec] = {}
+for _name, _spec in _THEME_SPECS.items():
+    _THEME_LOOKUP[sys.intern(_name)] = _spec
+    _THEME_LOOKUP[sys.intern(_name.lower())] = _spec
+del _name, _spec
+
+
+def _resolve_spec(theme: Optional[str]) -> ThemeSpec:
+    spec = _THEME_LOOKUP.get(theme)
+    if spec is None:
+        norm = (theme or "").strip()
+        spec = _THEME_LOOKUP.get(norm) or _THEME_LOOKUP.get(norm.lower()) or _DEFAULT_SPEC
+    return spec
 
 
 # --------------------------------------------------------------------------------------
 # Palette application (the key fix for "letters invisible")
 # --------------------------------------------------------------------------------------
 
+def _hex_to_argb(h: str) -> int:
+    """'#RRGGBB' -> opaque 0xAARRGGBB int for QColor's QRgb overload."""
+    return 0xFF000000 | int(h.lstrip("#"), 16)
+
+
+@lru_cache(maxsize=256)
+def _qcolor(spec: str) -> QColor:
+    """Hex string -> QColor, built once per distinct color for the process.
+
+    The int path skips Qt's named-color/hex lexer entirely.
+    """
+    from PySide6.QtGui import QColor
+
+    return QColor.fromRgba(_hex_to_argb(spec))
+
+
 def _apply_palette(app: QApplication, p: PaletteSpec) -> None:
+    # setPalette copies (Qt value semantics), so the cached instance is safe
+    # to hand out repeatedly.
+    app.setPalette(_make_palette(p))
+
+
+@lru_cache(maxsize=32)
+def _make_palette(p: PaletteSpec) -> QPalette:
+    # Built once per spec: hex parsing and the dozen setColor round-trips only
+    # run the first time a theme is selected. Keyed on the (frozen, hashable)
+    # PaletteSpec, so themes sharing a spec — Graphite/"Dark (Fluent 11)" and
+    # Paper/"Light (Fluent 11)" — share a single cached QPalette.
+    from PySide6.QtGui import QPalette
+
     pal = QPalette()
+    # One attribute lookup for the ~15 role assignments below.
+    setc = pal.setColor
 
-    window = QColor(p.window)
-    base = QColor(p.base)
-    alt = QColor(p.alt_base)
-    text = QColor(p.text)
-    dis = QColor(p.disabled_text)
-    button = QColor(p.button)
-    btn_text = QColor(p.button_text)
-    hi = QColor(p.highlight)
-    hi_text = QColor(p.highlighted_text)
-    link = QColor(p.link)
-    tip_base = QColor(p.tooltip_base)
-    tip_text = QColor(p.tooltip_text)
+    window = _qcolor(p.window)
+    base = _qcolor(p.base)
+    alt = _qcolor(p.alt_base)
+    text = _qcolor(p.text)
+    dis = _qcolor(p.disabled_text)
+    button = _qcolor(p.button)
+    btn_text = _qcolor(p.button_text)
+    hi = _qcolor(p.highlight)
+    hi_text = _qcolor(p.highlighted_text)
+    link = _qcolor(p.link)
+    tip_base = _qcolor(p.tooltip_base)
+    tip_text = _qcolor(p.tooltip_text)
 
-    pal.setColor(QPalette.Window, window)
-    pal.setColor(QPalette.WindowText, text)
+    setc(QPalette.Window, window)
+    setc(QPalette.WindowText, text)
 
-    pal.setColor(QPalette.Base, base)
-    pal.setColor(QPalette.AlternateBase, alt)
-    pal.setColor(QPalette.Text, text)
+    setc(QPalette.Base, base)
+    setc(QPalette.AlternateBase, alt)
+    setc(QPalette.Text, text)
 
-    pal.setColor(QPalette.Button, button)
-    pal.setColor(QPalette.ButtonText, btn_text)
+    setc(QPalette.Button, button)
+    setc(QPalette.ButtonText, btn_text)
 
-    pal.setColor(QPalette.Highlight, hi)
-    pal.setColor(QPalette.HighlightedText, hi_text)
+    setc(QPalette.Highlight, hi)
+    setc(QPalette.HighlightedText, hi_text)
 
-    pal.setColor(QPalette.Link, link)
+    setc(QPalette.Link, link)
 
-    pal.setColor(QPalette.ToolTipBase, tip_base)
-    pal.setColor(QPalette.ToolTipText, tip_text)
+    setc(QPalette.ToolTipBase, tip_base)
+    setc(QPalette.ToolTipText, tip_text)
 
     # Disabled
-    pal.setColor(QPalette.Disabled, QPalette.WindowText, dis)
-    pal.setColor(QPalette.Disabled, QPalette.Text, dis)
-    pal.setColor(QPalette.Disabled, QPalette.ButtonText, dis)
+    setc(QPalette.Disabled, QPalette.WindowText, dis)
+    setc(QPalette.Disabled, QPalette.Text, dis)
+    setc(QPalette.Disabled, QPalette.ButtonText, dis)
 
-    app.setPalette(pal)
+    return pal
 
 
 # --------------------------------------------------------------------------------------
 # QSS builder (more "effectful" look, Fluent-like option)
 # --------------------------------------------------------------------------------------
 
-def _build_qss(t: ThemeSpec) -> str:
-    p = t.palette
-    radius = t.radius
-    accent = t.accent
-    accent2 = t.accent_2
-
-    # spacing
-    pad_y = 7 if not t.dense else 5
-    pad_x = 10 if not t.dense else 8
-
-    # A subtle "Fluent-ish" appearance: rounded controls, softer borders, better focus
-    # Note: Qt can't do real Windows 11 acrylic; we emulate with clean shapes/colors.
-    fluent_extra = ""
-    if t.fluent:
-        fluent_extra = f"""
-/* Fluent-like details */
-QToolBar {{
-    background: {p.window};
-    border: none;
-    spacing: 6px;
-    padding: 6px;
-}}
-QToolButton {{
-    padding: 6px 10px;
-    border-radius: {radius}px;
-}}
-QToolButton:hover {{
-    background: {p.alt_base};
-}}
-QToolButton:checked {{
-    background: {accent};
-    color: {p.highlighted_text};
-}}
-QMenuBar {{
-    background: {p.window};
-    padding: 4px 6px;
-}}
-QMenuBar::item {{
-    padding: 6px 10px;
-    border-radius: {radius}px;
-}}
-QMenuBar::item:selected {{
-    background: {p.alt_base};
-}}
-"""
-
-    return f"""
+# The QSS body is a module-level template: str.format_map fills it in one C
+# call instead of re-executing a large f-string's bytecode per build.
+_QSS_TEMPLATE = """
 /* Global */
 * {{
-    font-size: {t.font_size_px}px;
+    font-size: {font_size_px}px;
 }}
 QWidget {{
-    background: {p.window};
-    color: {p.text};
+    background: {p_window};
+    color: {p_text};
 }}
 QGroupBox {{
-    border: 1px solid {p.border};
+    border: 1px solid {p_border};
     border-radius: {radius}px;
     margin-top: 10px;
     padding: 10px;
@@ -406,25 +447,25 @@ QGroupBox::title {{
     subcontrol-origin: margin;
     left: 10px;
     padding: 0 6px;
-    color: {p.text};
+    color: {p_text};
 }}
 QLabel {{
-    color: {p.text};
+    color: {p_text};
 }}
 
 /* Inputs */
 QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QDateEdit, QTimeEdit, QDateTimeEdit, QComboBox {{
-    background: {p.base};
-    color: {p.text};
-    border: 1px solid {p.border};
+    background: {p_base};
+    color: {p_text};
+    border: 1px solid {p_border};
     border-radius: {radius}px;
     padding: {pad_y}px {pad_x}px;
-    selection-background-color: {p.highlight};
-    selection-color: {p.highlighted_text};
+    selection-background-color: {p_highlight};
+    selection-color: {p_highlighted_text};
 }}
 QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {{
     border: 2px solid {accent};
-    padding: {max(0, pad_y-1)}px {max(0, pad_x-1)}px;
+    padding: {pad_y_focus}px {pad_x_focus}px;
 }}
 
 /* Combo */
@@ -433,19 +474,19 @@ QComboBox::drop-down {{
     width: 24px;
 }}
 QComboBox QAbstractItemView {{
-    background: {p.base};
-    color: {p.text};
-    border: 1px solid {p.border};
-    selection-background-color: {p.highlight};
-    selection-color: {p.highlighted_text};
+    background: {p_base};
+    color: {p_text};
+    border: 1px solid {p_border};
+    selection-background-color: {p_highlight};
+    selection-color: {p_highlighted_text};
     outline: 0;
 }}
 
 /* Buttons */
 QPushButton {{
-    background: {p.button};
-    color: {p.button_text};
-    border: 1px solid {p.border};
+    background: {p_button};
+    color: {p_button_text};
+    border: 1px solid {p_border};
     border-radius: {radius}px;
     padding: {pad_y}px {pad_x}px;
 }}
@@ -453,15 +494,15 @@ QPushButton:hover {{
     border-color: {accent2};
 }}
 QPushButton:pressed {{
-    background: {p.alt_base};
+    background: {p_alt_base};
 }}
 QPushButton:disabled {{
-    color: {p.disabled_text};
-    border-color: {p.border};
+    color: {p_disabled_text};
+    border-color: {p_border};
 }}
 QPushButton#primary, QPushButton[primary="true"] {{
     background: {accent};
-    color: {p.highlighted_text};
+    color: {p_highlighted_text};
     border: 1px solid {accent};
 }}
 QPushButton#primary:hover, QPushButton[primary="true"]:hover {{
@@ -471,14 +512,14 @@ QPushButton#primary:hover, QPushButton[primary="true"]:hover {{
 
 /* Tabs */
 QTabWidget::pane {{
-    border: 1px solid {p.border};
+    border: 1px solid {p_border};
     border-radius: {radius}px;
     top: -1px;
 }}
 QTabBar::tab {{
-    background: {p.window};
-    color: {p.text};
-    border: 1px solid {p.border};
+    background: {p_window};
+    color: {p_text};
+    border: 1px solid {p_border};
     border-bottom: none;
     padding: 8px 12px;
     border-top-left-radius: {radius}px;
@@ -486,7 +527,7 @@ QTabBar::tab {{
     margin-right: 4px;
 }}
 QTabBar::tab:selected {{
-    background: {p.base};
+    background: {p_base};
     border-color: {accent};
 }}
 QTabBar::tab:hover {{
@@ -495,22 +536,22 @@ QTabBar::tab:hover {{
 
 /* Tables */
 QTableView {{
-    background: {p.base};
-    alternate-background-color: {p.alt_base};
-    gridline-color: {p.border};
-    color: {p.text};
-    border: 1px solid {p.border};
+    background: {p_base};
+    alternate-background-color: {p_alt_base};
+    gridline-color: {p_border};
+    color: {p_text};
+    border: 1px solid {p_border};
     border-radius: {radius}px;
 }}
 QHeaderView::section {{
-    background: {p.alt_base};
-    color: {p.text};
+    background: {p_alt_base};
+    color: {p_text};
     border: none;
     padding: 6px 8px;
 }}
 QTableView::item:selected {{
-    background: {p.highlight};
-    color: {p.highlighted_text};
+    background: {p_highlight};
+    color: {p_highlighted_text};
 }}
 
 /* Scrollbars (clean) */
@@ -520,7 +561,7 @@ QScrollBar:vertical {{
     margin: 6px 4px 6px 4px;
 }}
 QScrollBar::handle:vertical {{
-    background: {p.border};
+    background: {p_border};
     border-radius: 6px;
     min-height: 24px;
 }}
@@ -536,7 +577,7 @@ QScrollBar:horizontal {{
     margin: 4px 6px 4px 6px;
 }}
 QScrollBar::handle:horizontal {{
-    background: {p.border};
+    background: {p_border};
     border-radius: 6px;
     min-width: 24px;
 }}
@@ -549,9 +590,9 @@ QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
 
 /* Menus */
 QMenu {{
-    background: {p.base};
-    color: {p.text};
-    border: 1px solid {p.border};
+    background: {p_base};
+    color: {p_text};
+    border: 1px solid {p_border};
     border-radius: {radius}px;
     padding: 6px;
 }}
@@ -560,27 +601,125 @@ QMenu::item {{
     border-radius: {radius}px;
 }}
 QMenu::item:selected {{
-    background: {p.highlight};
-    color: {p.highlighted_text};
+    background: {p_highlight};
+    color: {p_highlighted_text};
 }}
 
 /* Tooltips */
 QToolTip {{
-    background: {p.tooltip_base};
-    color: {p.tooltip_text};
-    border: 1px solid {p.border};
+    background: {p_tooltip_base};
+    color: {p_tooltip_text};
+    border: 1px solid {p_border};
     padding: 6px;
     border-radius: {radius}px;
 }}
+"""
 
-{fluent_extra}
+# A subtle "Fluent-ish" appearance: rounded controls, softer borders, better focus.
+# Note: Qt can't do real Windows 11 acrylic; we emulate with clean shapes/colors.
+_QSS_FLUENT_TEMPLATE = """
+/* Fluent-like details */
+QToolBar {{
+    background: {p_window};
+    border: none;
+    spacing: 6px;
+    padding: 6px;
+}}
+QToolButton {{
+    padding: 6px 10px;
+    border-radius: {radius}px;
+}}
+QToolButton:hover {{
+    background: {p_alt_base};
+}}
+QToolButton:checked {{
+    background: {accent};
+    color: {p_highlighted_text};
+}}
+QMenuBar {{
+    background: {p_window};
+    padding: 4px 6px;
+}}
+QMenuBar::item {{
+    padding: 6px 10px;
+    border-radius: {radius}px;
+}}
+QMenuBar::item:selected {{
+    background: {p_alt_base};
+}}
 """
 
 
+@lru_cache(maxsize=32)
+def _qss_fields(t: ThemeSpec) -> Dict[str, object]:
+    """Flat placeholder mapping shared by the main and fluent templates.
+
+    Memoized so the dict is assembled once per spec even though both the main
+    and fluent builders consume it; callers only read it.
+    """
+    p = t.palette
+
+    # Spacing (focus borders are 1px thicker, so focus padding shrinks by 1
+    # to keep control sizes stable; clamped at zero).
+    pad_y = 7 if not t.dense else 5
+    pad_x = 10 if not t.dense else 8
+    pad_y_focus = pad_y - 1 if pad_y > 0 else 0
+    pad_x_focus = pad_x - 1 if pad_x > 0 else 0
+
+    return {
+        "radius": t.radius,
+        "accent": t.accent,
+        "accent2": t.accent_2,
+        "font_size_px": t.font_size_px,
+        "pad_y": pad_y,
+        "pad_x": pad_x,
+        "pad_y_focus": pad_y_focus,
+        "pad_x_focus": pad_x_focus,
+        "p_window": p.window,
+        "p_base": p.base,
+        "p_alt_base": p.alt_base,
+        "p_text": p.text,
+        "p_disabled_text": p.disabled_text,
+        "p_button": p.button,
+        "p_button_text": p.button_text,
+        "p_highlight": p.highlight,
+        "p_highlighted_text": p.highlighted_text,
+        "p_border": p.border,
+        "p_tooltip_base": p.tooltip_base,
+        "p_tooltip_text": p.tooltip_text,
+    }
+
+
+@lru_cache(maxsize=32)
+def _fluent_fragment(t: ThemeSpec) -> str:
+    """Fluent-only QSS block, formatted at most once per fluent spec."""
+    return _QSS_FLUENT_TEMPLATE.format_map(_qss_fields(t))
+
+
+@lru_cache(maxsize=32)
+def _build_qss(t: ThemeSpec) -> str:
+    # ThemeSpec/PaletteSpec are frozen dataclasses, so the ~3 KB sheet is pure
+    # in its spec: build it once per theme and reuse on later switches. The
+    # fluent fragment only pays its format cost for fluent themes.
+    #
+    # This is effectively ahead-of-time evaluation per process: after the
+    # first switch to a theme every variable has been substituted and the
+    # constant string is served from the cache, so pre-generating per-theme
+    # QSS source files would only duplicate the specs without saving work.
+    qss = _QSS_TEMPLATE.format_map(_qss_fields(t))
+    if t.fluent:
+        qss += _fluent_fragment(t)
+    return qss
+
+
 # --------------------------------------------------------------------------------------
 # Optional helper
 # --------------------------------------------------------------------------------------
 
+# Constant form for callers that just need the name without a function call.
+DEFAULT_THEME: Final[str] = sys.intern("Fusion Light (Fluent 11)")
+
+
 def default_theme() -> str:
     """If you need a consistent default, call this."""
-    return "Fusion Light (Fluent 11)"
+    return DEFAULT_THEME